@@ -8,78 +8,252 @@ This script checks:
 3. Existing modules and their RNBO export status
 4. Provides next step recommendations
 
+Use --verbose to report each tool's version instead of its path. Those
+version probes are cached for a few minutes in
+~/.cache/percussa-rnbo-check/probes.json, use --no-cache to skip this.
+
 Compatible with Windows, macOS, and Linux.
 """
 
+import argparse
+import functools
+import hashlib
+import itertools
+import json
 import os
 import sys
 import platform
 import subprocess
 import shutil
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Successful version probes are cached between runs. CACHE_FILE is relative to home
+CACHE_FILE = Path(".cache") / "percussa-rnbo-check" / "probes.json"
+TOOL_CACHE_TTL = 5 * 60
+
+# Platform is fixed for the life of the process, detect it once
+_SYSTEM = platform.system()
+_IS_MACOS = _SYSTEM == "Darwin"
+_IS_LINUX = _SYSTEM == "Linux"
+_IS_WINDOWS = _SYSTEM == "Windows"
+
+# Entries in modules/ that are not modules
+_MODULE_SKIP = frozenset({"common", "inc", ".gitignore"})
+
+
+@functools.lru_cache(maxsize=None)
+def _probe_tool(command, version_arg=None):
+    """Probe a tool and return (ok, detail)
+
+    Without a version_arg only PATH is searched and detail is the tool's path,
+    otherwise the tool is run and detail is the first line of its output.
+    A version command should answer well within the 2s timeout, anything
+    slower is treated as not found.
+    """
+    if version_arg is None:
+        path = shutil.which(command)
+        if path:
+            return True, path
+        return False, "not found"
+    try:
+        result = subprocess.run([command, version_arg], stdout=subprocess.PIPE,
+                              stderr=subprocess.DEVNULL, text=True, timeout=2)
+        if result.returncode == 0:
+            return True, result.stdout.strip().split('\n')[0]
+        return False, "not working properly"
+    except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
+        return False, "not found"
+
+
+def _scan_dir(path):
+    """Return {name: DirEntry} for a directory, or an empty dict if it can't be read"""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name: entry for entry in it}
+    except OSError:
+        return {}
+
+
+def _all_relpaths_exist(root, relpaths):
+    """Check '/' separated relative paths exist under root, reading each directory once"""
+    listings = {}
+    for relpath in relpaths:
+        parent = os.fspath(root)
+        for name in relpath.split("/"):
+            if parent not in listings:
+                listings[parent] = _scan_dir(parent)
+            if name not in listings[parent]:
+                return False
+            parent = os.path.join(parent, name)
+    return True
+
+
+def _has_rnbo_export(rnbo_dir):
+    """Check an export directory has a .cpp.h file, stopping at the first one"""
+    try:
+        with os.scandir(rnbo_dir) as it:
+            return any(entry.name.endswith(".cpp.h") for entry in it)
+    except OSError:
+        return False
+
 
 class EnvironmentChecker:
-    def __init__(self):
-        self.system = platform.system()
-        self.is_macos = self.system == "Darwin"
-        self.is_linux = self.system == "Linux"
-        self.is_windows = self.system == "Windows"
-        self.project_root = Path(__file__).parent.parent
-        self.issues = []
-        self.warnings = []
-        self.successes = []
+    REQUIRED_TOOLS = ["cmake", "git"]
+
+    __slots__ = ("_compiler_tools", "_home", "project_root", "_project_root_str", "_modules_dir_str",
+                 "_modules", "_messages", "_counts", "use_cache", "_version_arg", "_path_hash",
+                 "_probe_cache")
+
+    def __init__(self, use_cache=True, verbose=False, project_root=None):
+        # Compilation tools needed on this platform, Windows is unsupported
+        self._compiler_tools = []
+        if _IS_MACOS or _IS_LINUX:
+            self._compiler_tools = ["clang", "clang++"] + (["arm-linux-gnueabihf-gcc"] if _IS_LINUX else [])
+        # home is looked up on first use, the probe cache is loaded by run()
+        self._home = None
+        self._path_hash = hashlib.sha1(os.environ.get("PATH", "").encode()).hexdigest()
+        self._probe_cache = {}
+        self.project_root = Path(project_root) if project_root else Path(__file__).parent.parent
+        # plain string paths for the scandir based scans
+        self._project_root_str = str(self.project_root)
+        self._modules_dir_str = os.path.join(self._project_root_str, "modules")
+        self._modules = None
+        # messages grouped by level as they are logged, so reports never re-scan them
+        self._messages = {"OK": [], "WARN": [], "FAIL": []}
+        self._counts = Counter()
+        # only --verbose version probes spawn processes, so only they are worth caching
+        self.use_cache = use_cache and verbose
+        # verbose runs each tool to report its version rather than its path
+        self._version_arg = "--version" if verbose else None
+
+    def _home_dir(self):
+        """Return the user's home directory, looked up once"""
+        if self._home is None:
+            self._home = Path.home()
+        return self._home
 
     def log_success(self, message):
         """Log a successful check"""
-        self.successes.append("OK " + message)
+        self._record("OK", message)
 
     def log_warning(self, message):
         """Log a warning"""
-        self.warnings.append("WARN " + message)
+        self._record("WARN", message)
 
     def log_issue(self, message):
         """Log an issue"""
-        self.issues.append("FAIL " + message)
+        self._record("FAIL", message)
+
+    def _record(self, level, message):
+        """Add a message to its level and count it"""
+        self._messages[level].append(message)
+        self._counts[level] += 1
+
+    def _print_messages(self, level):
+        """Print all logged messages of one level"""
+        for message in self._messages[level]:
+            print("   " + level + " " + message)
 
-    def check_command(self, command, version_arg="--version"):
-        """Check if a command is available and return its version info"""
+    def _load_probe_cache(self):
+        """Load cached probe results from previous runs"""
         try:
-            result = subprocess.run([command, version_arg], 
-                                  capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                version = result.stdout.strip().split('\n')[0]
-                self.log_success(command + " found: " + version)
-                return True
-            else:
-                self.log_issue(command + " not working properly")
-                return False
-        except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
-            self.log_issue(command + " not found")
-            return False
+            with open(self._home_dir() / CACHE_FILE) as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(cache, dict):
+            return {}
+        # a damaged cache must never break the checks, drop anything malformed
+        return {key: entry for key, entry in cache.items()
+                if isinstance(entry, dict)
+                and isinstance(entry.get("result"), str)
+                and isinstance(entry.get("time"), (int, float))}
+
+    def _save_probe_cache(self):
+        """Write probe results back, dropping anything past its TTL"""
+        now = time.time()
+        cache = {key: entry for key, entry in self._probe_cache.items()
+                 if now - entry["time"] < TOOL_CACHE_TTL}
+        try:
+            cache_file = self._home_dir() / CACHE_FILE
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, "w") as f:
+                json.dump(cache, f)
+        except OSError:
+            pass
+
+    def _cache_get(self, key, ttl):
+        """Return a cached result if it is within ttl seconds, else None"""
+        entry = self._probe_cache.get(key)
+        if entry is not None and time.time() - entry["time"] < ttl:
+            return entry["result"]
+        return None
+
+    def _cache_put(self, key, result):
+        """Cache a result, only done for successes so fixes show up immediately"""
+        if self.use_cache:
+            self._probe_cache[key] = {"time": time.time(), "result": result}
+
+    def _tool_cache_key(self, command, version_arg=None):
+        """Tool probes depend on PATH, so key them by a hash of it"""
+        key = self._path_hash + ":" + command
+        if version_arg is not None:
+            key += " " + version_arg
+        return key
+
+    def _probe(self, command, version_arg=None):
+        """Probe a tool, using the cache file for version probes"""
+        if version_arg is None:
+            return _probe_tool(command, None)
+        key = self._tool_cache_key(command, version_arg)
+        cached = self._cache_get(key, TOOL_CACHE_TTL)
+        if cached is not None:
+            return True, cached
+        ok, detail = _probe_tool(command, version_arg)
+        if ok:
+            self._cache_put(key, detail)
+        return ok, detail
+
+    def probe_tools(self, tools, version_arg=None):
+        """Run uncached version probes concurrently, results are logged later by check_command
+
+        Each version probe is a subprocess, so running them at once costs the
+        slowest tool rather than the sum. Plain PATH lookups are cheaper than
+        the thread pool and are left to check_command.
+        """
+        if version_arg is None:
+            return
+        uncached = [tool for tool in tools
+                    if self._cache_get(self._tool_cache_key(tool, version_arg), TOOL_CACHE_TTL) is None]
+        if not uncached:
+            return
+        with ThreadPoolExecutor(max_workers=len(uncached)) as executor:
+            # same (command, version_arg) key as _probe, so check_command hits the lru_cache
+            list(executor.map(_probe_tool, uncached, itertools.repeat(version_arg)))
+
+    def check_command(self, command, version_arg=None):
+        """Check if a command is available and log its path, or version if version_arg is given"""
+        ok, detail = self._probe(command, version_arg)
+        if ok:
+            self.log_success(command + " found: " + detail)
+        else:
+            self.log_issue(command + " " + detail)
+        return ok
 
     def check_basic_tools(self):
         """Check for basic development tools"""
         print("Checking basic development tools...")
         
-        required_tools = ["cmake", "git"]
-        optional_tools = ["python3", "python"]
-        
         all_good = True
-        for tool in required_tools:
-            if not self.check_command(tool):
+        for tool in self.REQUIRED_TOOLS:
+            if not self.check_command(tool, self._version_arg):
                 all_good = False
         
-        # Check Python (either python3 or python)
-        python_found = False
-        for py_cmd in optional_tools:
-            if self.check_command(py_cmd):
-                python_found = True
-                break
-        
-        if not python_found:
-            self.log_issue("Python not found (needed for scripts)")
-            all_good = False
+        # We're already running on a working Python, no need to probe for one
+        self.log_success("python found: " + sys.executable + " (" + sys.version.split()[0] + ")")
         
         return all_good
 
@@ -87,37 +261,19 @@ class EnvironmentChecker:
         """Check for compilation tools specific to platform"""
         print("\nChecking compilation tools...")
         
-        if self.is_windows:
-            self.log_issue("Windows is not supported for cross-compilation")
-            return False
-        
         all_good = True
+        for tool in self._compiler_tools:
+            if not self.check_command(tool, self._version_arg):
+                all_good = False
         
-        if self.is_macos:
-            # Check for clang and llvm tools
-            tools = ["clang", "clang++"]
-            for tool in tools:
-                if not self.check_command(tool):
-                    all_good = False
-            
+        if _IS_MACOS:
             # Check if homebrew LLVM is available
             homebrew_paths = ["/opt/homebrew/opt/llvm/bin", "/usr/local/opt/llvm/bin"]
-            llvm_found = False
-            for path in homebrew_paths:
-                if Path(path).exists():
-                    self.log_success("LLVM tools found at " + path)
-                    llvm_found = True
-                    break
-            
-            if not llvm_found:
+            llvm_path = next((p for p in homebrew_paths if os.path.isdir(p)), None)
+            if llvm_path:
+                self.log_success("LLVM tools found at " + llvm_path)
+            else:
                 self.log_warning("Homebrew LLVM not found. Install with: brew install llvm")
-            
-        elif self.is_linux:
-            # Check for cross-compilation tools
-            tools = ["clang", "clang++", "arm-linux-gnueabihf-gcc"]
-            for tool in tools:
-                if not self.check_command(tool):
-                    all_good = False
         
         return all_good
 
@@ -129,13 +285,13 @@ class EnvironmentChecker:
         ssp_buildroot = os.environ.get('SSP_BUILDROOT')
         if ssp_buildroot:
             ssp_path = Path(ssp_buildroot)
-            if ssp_path.exists():
+            if os.path.exists(ssp_path):
                 # Check for expected subdirectories
                 expected_paths = [
-                    ssp_path / "arm-rockchip-linux-gnueabihf" / "sysroot",
-                    ssp_path / "lib" / "gcc" / "arm-rockchip-linux-gnueabihf"
+                    "arm-rockchip-linux-gnueabihf/sysroot",
+                    "lib/gcc/arm-rockchip-linux-gnueabihf"
                 ]
-                if all(p.exists() for p in expected_paths):
+                if _all_relpaths_exist(ssp_path, expected_paths):
                     self.log_success("SSP_BUILDROOT valid: " + ssp_buildroot)
                 else:
                     self.log_warning("SSP_BUILDROOT path exists but missing expected subdirectories: " + ssp_buildroot)
@@ -143,8 +299,8 @@ class EnvironmentChecker:
                 self.log_issue("SSP_BUILDROOT path does not exist: " + ssp_buildroot)
         else:
             # Check default location
-            default_path = Path.home() / "buildroot" / "arm-rockchip-linux-gnueabihf_sdk-buildroot"
-            if default_path.exists():
+            default_path = self._home_dir() / "buildroot" / "arm-rockchip-linux-gnueabihf_sdk-buildroot"
+            if os.path.exists(default_path):
                 self.log_success("Default SSP buildroot found: " + str(default_path))
                 self.log_warning("Consider setting SSP_BUILDROOT environment variable")
             else:
@@ -155,12 +311,12 @@ class EnvironmentChecker:
         xmx_buildroot = os.environ.get('XMX_BUILDROOT')
         if xmx_buildroot:
             xmx_path = Path(xmx_buildroot)
-            if xmx_path.exists():
+            if os.path.exists(xmx_path):
                 expected_paths = [
-                    xmx_path / "aarch64-rockchip-linux-gnu" / "sysroot",
-                    xmx_path / "lib" / "gcc" / "aarch64-rockchip-linux-gnu"
+                    "aarch64-rockchip-linux-gnu/sysroot",
+                    "lib/gcc/aarch64-rockchip-linux-gnu"
                 ]
-                if all(p.exists() for p in expected_paths):
+                if _all_relpaths_exist(xmx_path, expected_paths):
                     self.log_success("XMX_BUILDROOT valid: " + xmx_buildroot)
                 else:
                     self.log_warning("XMX_BUILDROOT path exists but missing expected subdirectories: " + xmx_buildroot)
@@ -169,8 +325,8 @@ class EnvironmentChecker:
         else:
             self.log_warning("XMX_BUILDROOT not set (only needed for XMX builds)")
             # Check default location
-            default_path = Path.home() / "buildroot" / "aarch64-rockchip-linux-gnu_sdk-buildroot"
-            if default_path.exists():
+            default_path = self._home_dir() / "buildroot" / "aarch64-rockchip-linux-gnu_sdk-buildroot"
+            if os.path.exists(default_path):
                 self.log_success("Default XMX buildroot found: " + str(default_path))
                 self.log_warning("Consider setting XMX_BUILDROOT environment variable")
             else:
@@ -192,20 +348,28 @@ class EnvironmentChecker:
             ("scripts/addDemo.py", "file"),
         ]
         
+        # one readdir per parent directory, DirEntry caches the file type
+        scanned = {}
+
+        def find_entry(path):
+            if path.parent not in scanned:
+                scanned[path.parent] = _scan_dir(path.parent)
+            return scanned[path.parent].get(path.name)
+
         all_good = True
         for path_str, path_type in key_paths:
-            path = self.project_root / path_str
-            if path_type == "file" and path.is_file():
+            entry = find_entry(self.project_root / path_str)
+            if path_type == "file" and entry is not None and entry.is_file():
                 self.log_success("Found " + path_str)
-            elif path_type == "dir" and path.is_dir():
+            elif path_type == "dir" and entry is not None and entry.is_dir():
                 self.log_success("Found " + path_str + "/")
             else:
                 self.log_issue("Missing " + path_str)
                 all_good = False
         
         # Check if JUCE submodule is initialized
-        juce_cmake = self.project_root / "juce" / "CMakeLists.txt"
-        if juce_cmake.exists():
+        juce_cmake = find_entry(self.project_root / "juce" / "CMakeLists.txt")
+        if juce_cmake is not None and juce_cmake.is_file():
             self.log_success("JUCE submodule initialized")
         else:
             self.log_issue("JUCE submodule not initialized")
@@ -215,53 +379,59 @@ class EnvironmentChecker:
         return all_good
 
     def find_modules(self):
-        """Find all existing modules and check their status"""
-        modules_dir = self.project_root / "modules"
+        """Find all existing modules and check their status, scanned once per run"""
+        if self._modules is not None:
+            return self._modules
+        
         modules = []
         
-        if not modules_dir.exists():
-            return modules
-        
-        for item in modules_dir.iterdir():
-            if item.is_dir() and item.name not in ["common", "inc", ".gitignore"]:
-                module_info = {
-                    "name": item.name,
-                    "path": item,
-                    "has_source": False,
-                    "has_rnbo_export": False,
-                    "rnbo_export_path": None,
-                    "missing_files": []
-                }
-                
-                # Check for Source directory
-                source_dir = item / "Source"
-                if source_dir.exists():
-                    module_info["has_source"] = True
-                else:
-                    module_info["missing_files"].append("Source/")
-                
-                # Check for RNBO export - try different naming patterns
-                possible_rnbo_dirs = [
-                    item / f"{item.name}-rnbo",
-                    item / f"{item.name}-export", 
-                    item / "rnbo-export",
-                    item / "export"
-                ]
-                
-                for rnbo_dir in possible_rnbo_dirs:
-                    if rnbo_dir.exists():
-                        module_info["rnbo_export_path"] = rnbo_dir
-                        # Check for key RNBO files
-                        rnbo_files = list(rnbo_dir.glob("*.cpp.h"))
-                        if rnbo_files:
-                            module_info["has_rnbo_export"] = True
-                        break
-                
-                if not module_info["has_rnbo_export"]:
-                    module_info["missing_files"].append(item.name + "-rnbo/ (with .cpp.h files)")
-                
-                modules.append(module_info)
+        try:
+            with os.scandir(self._modules_dir_str) as it:
+                module_entries = [entry for entry in it
+                                  if entry.name not in _MODULE_SKIP and entry.is_dir()]
+        except OSError:
+            module_entries = []
+        
+        for entry in module_entries:
+            child_entries = _scan_dir(entry.path)
+            module_info = {
+                "name": entry.name,
+                "path": Path(entry.path),
+                "has_source": False,
+                "has_rnbo_export": False,
+                "rnbo_export_path": None,
+                "missing_files": []
+            }
+            
+            # Check for Source directory
+            source_entry = child_entries.get("Source")
+            if source_entry is not None and source_entry.is_dir():
+                module_info["has_source"] = True
+            else:
+                module_info["missing_files"].append("Source/")
+            
+            # Check for RNBO export - try different naming patterns
+            possible_rnbo_dirs = [
+                f"{entry.name}-rnbo",
+                f"{entry.name}-export",
+                "rnbo-export",
+                "export"
+            ]
+            
+            for rnbo_name in possible_rnbo_dirs:
+                if rnbo_name in child_entries:
+                    rnbo_dir = os.path.join(entry.path, rnbo_name)
+                    module_info["rnbo_export_path"] = Path(rnbo_dir)
+                    # Check for key RNBO files
+                    module_info["has_rnbo_export"] = _has_rnbo_export(rnbo_dir)
+                    break
+            
+            if not module_info["has_rnbo_export"]:
+                module_info["missing_files"].append(entry.name + "-rnbo/ (with .cpp.h files)")
+            
+            modules.append(module_info)
         
+        self._modules = modules
         return modules
 
     def check_modules(self):
@@ -288,17 +458,15 @@ class EnvironmentChecker:
         
         modules = self.find_modules()
         
-        if self.issues:
+        if self._counts["FAIL"]:
             print("\nCRITICAL ISSUES - Fix these first:")
-            for issue in self.issues:
-                print("   " + issue)
+            self._print_messages("FAIL")
             print("\n   See setup guide: docs/setup.md")
             return
         
-        if self.warnings:
+        if self._counts["WARN"]:
             print("\nWARNINGS - Consider addressing:")
-            for warning in self.warnings:
-                print("   " + warning)
+            self._print_messages("WARN")
         
         print("\nEnvironment looks good!")
         
@@ -335,44 +503,64 @@ class EnvironmentChecker:
         
         print("\nFull documentation: docs/creatingmodules.md")
 
+    def _print_summary(self):
+        """Print all logged results grouped by level"""
+        print("\n" + "=" * 50)
+        print("SUMMARY")
+        print("=" * 50)
+        
+        for level, label in (("OK", "items OK"), ("WARN", "warnings"), ("FAIL", "issues")):
+            if self._counts[level]:
+                print("\n[" + level + "] " + str(self._counts[level]) + " " + label + ":")
+                self._print_messages(level)
+
     def run(self):
         """Run all checks and provide summary"""
         print("Percussa RNBO Environment Checker")
         print("=" * 50)
         
+        # Nothing else matters if we can't build here, so don't probe anything
+        if _IS_WINDOWS:
+            self.log_issue("Windows is not supported for cross-compilation")
+            self._print_summary()
+            return False
+        
+        if self.use_cache:
+            self._probe_cache = self._load_probe_cache()
+        
+        # With --verbose, start every version probe at once up front
+        all_tools = self.REQUIRED_TOOLS + self._compiler_tools
+        self.probe_tools(all_tools, self._version_arg)
+        
         self.check_basic_tools()
         self.check_compiler_tools()
         self.check_environment_variables()
         self.check_project_structure()
         self.check_modules()
         
-        print("\n" + "=" * 50)
-        print("SUMMARY")
-        print("=" * 50)
-        
-        if self.successes:
-            print("\n[OK] " + str(len(self.successes)) + " items OK:")
-            for success in self.successes:
-                print("   " + success)
-        
-        if self.warnings:
-            print("\n[WARN] " + str(len(self.warnings)) + " warnings:")
-            for warning in self.warnings:
-                print("   " + warning)
-        
-        if self.issues:
-            print("\n[FAIL] " + str(len(self.issues)) + " issues:")
-            for issue in self.issues:
-                print("   " + issue)
+        self._print_summary()
         
         self.suggest_next_steps()
         
-        return len(self.issues) == 0
+        if self.use_cache:
+            self._save_probe_cache()
+        
+        return self._counts["FAIL"] == 0
 
 
 def main():
     """Main entry point"""
-    checker = EnvironmentChecker()
+    parser = argparse.ArgumentParser(
+        description="Check the Percussa RNBO development environment and project status"
+    )
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Ignore and do not update cached probe results')
+    parser.add_argument('--verbose', action='store_true',
+                       help='Run each tool to report its version (slower)')
+    
+    args = parser.parse_args()
+    
+    checker = EnvironmentChecker(use_cache=not args.no_cache, verbose=args.verbose)
     success = checker.run()
     sys.exit(0 if success else 1)
 
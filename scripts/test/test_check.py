@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+test_check.py - Tests for check.py
+
+Run with: python -m unittest discover scripts/test
+"""
+
+import contextlib
+import io
+import json
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import check
+
+
+class ProbeTest(unittest.TestCase):
+    TOOLS = ["cmake", "git", "clang"]
+
+    def setUp(self):
+        check._probe_tool.cache_clear()
+        self.addCleanup(check._probe_tool.cache_clear)
+
+    def test_path_lookup_once(self):
+        """PATH lookups are done once each, directly by check_command"""
+        with mock.patch("check.shutil.which", side_effect=lambda cmd: "/usr/bin/" + cmd) as which:
+            checker = check.EnvironmentChecker(use_cache=False)
+            checker.probe_tools(self.TOOLS)
+            self.assertEqual(which.call_count, 0)
+            for tool in self.TOOLS:
+                self.assertTrue(checker.check_command(tool))
+        self.assertEqual(which.call_count, len(self.TOOLS))
+        self.assertIn("cmake found: /usr/bin/cmake", checker._messages["OK"])
+
+    def test_missing_tool(self):
+        with mock.patch("check.shutil.which", return_value=None):
+            checker = check.EnvironmentChecker(use_cache=False)
+            self.assertFalse(checker.check_command("cmake"))
+        self.assertEqual(checker._messages["FAIL"], ["cmake not found"])
+
+    def test_version_probes_run_once(self):
+        """The concurrent pass runs each version probe, check_command reuses it"""
+        def fake_run(args, **kwargs):
+            return subprocess.CompletedProcess(args, 0, stdout=args[0] + " version 1\n")
+
+        with mock.patch("check.subprocess.run", side_effect=fake_run) as run:
+            checker = check.EnvironmentChecker(use_cache=False, verbose=True)
+            checker.probe_tools(self.TOOLS, "--version")
+            self.assertEqual(run.call_count, len(self.TOOLS))
+            for tool in self.TOOLS:
+                self.assertTrue(checker.check_command(tool, "--version"))
+        self.assertEqual(run.call_count, len(self.TOOLS))
+        self.assertIn("git found: git version 1", checker._messages["OK"])
+
+
+class CacheFileTest(unittest.TestCase):
+    def test_malformed_entries_dropped(self):
+        """A damaged cache file is ignored rather than breaking the checks"""
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_file = Path(tmp) / "probes.json"
+            checker = check.EnvironmentChecker(verbose=True)
+            git_key = checker._tool_cache_key("git", "--version")
+            cache_file.write_text(json.dumps({
+                "a": 1,
+                "b": {"result": 1},
+                "c": {"time": "x", "result": 1},
+                "d": {"time": 0, "result": "cmake version 1"},
+                "f": {"time": 0, "result": True},
+                git_key: {"time": time.time(), "result": 1},
+            }))
+            with mock.patch.object(check, "CACHE_FILE", cache_file):
+                checker._probe_cache = checker._load_probe_cache()
+        self.assertEqual(list(checker._probe_cache), ["d"])
+
+        check._probe_tool.cache_clear()
+        self.addCleanup(check._probe_tool.cache_clear)
+        result = subprocess.CompletedProcess(["git"], 0, stdout="git version 1\n")
+        with mock.patch("check.subprocess.run", return_value=result):
+            self.assertTrue(checker.check_command("git", "--version"))
+
+
+class WindowsTest(unittest.TestCase):
+    def test_fails_before_any_probes(self):
+        """On Windows run() stops before touching PATH, home or the cache file"""
+        with mock.patch.object(check, "_IS_WINDOWS", True), \
+                mock.patch("check.shutil.which") as which, \
+                mock.patch("check.subprocess.run") as run, \
+                mock.patch.object(check.Path, "home") as home:
+            checker = check.EnvironmentChecker()
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertFalse(checker.run())
+        which.assert_not_called()
+        run.assert_not_called()
+        home.assert_not_called()
+        self.assertEqual(checker._messages["FAIL"], ["Windows is not supported for cross-compilation"])
+
+
+class StandaloneCheckTest(unittest.TestCase):
+    def test_checks_work_without_run(self):
+        """Individual checks can be called on a fresh checker"""
+        check._probe_tool.cache_clear()
+        self.addCleanup(check._probe_tool.cache_clear)
+        with tempfile.TemporaryDirectory() as tmp, \
+                mock.patch("check.shutil.which", return_value=None), \
+                mock.patch.object(check.Path, "home", return_value=Path(tmp)), \
+                mock.patch.dict(check.os.environ, {}, clear=True):
+            checker = check.EnvironmentChecker(use_cache=False)
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertFalse(checker.check_basic_tools())
+                checker.check_environment_variables()
+        self.assertIn("cmake not found", checker._messages["FAIL"])
+        self.assertIn("SSP_BUILDROOT not set and default location not found", checker._messages["FAIL"])
+
+
+def make_tree(root, dirs=(), files=()):
+    """Create directories and empty files under root"""
+    for d in dirs:
+        (root / d).mkdir(parents=True, exist_ok=True)
+    for f in files:
+        (root / f).parent.mkdir(parents=True, exist_ok=True)
+        (root / f).touch()
+
+
+class ProjectStructureTest(unittest.TestCase):
+    def check(self, dirs=(), files=()):
+        with tempfile.TemporaryDirectory() as tmp:
+            make_tree(Path(tmp), dirs, files)
+            checker = check.EnvironmentChecker(use_cache=False, project_root=tmp)
+            with contextlib.redirect_stdout(io.StringIO()):
+                ok = checker.check_project_structure()
+        return ok, checker._messages
+
+    def test_complete_project(self):
+        ok, messages = self.check(
+            dirs=["ssp-sdk", "modules", "template/module"],
+            files=["CMakeLists.txt", "juce/CMakeLists.txt",
+                   "scripts/createModule.py", "scripts/addDemo.py"])
+        self.assertTrue(ok)
+        self.assertIn("Found juce/", messages["OK"])
+        self.assertIn("Found scripts/addDemo.py", messages["OK"])
+        self.assertIn("JUCE submodule initialized", messages["OK"])
+        self.assertEqual(messages["FAIL"], [])
+
+    def test_missing_and_wrong_type(self):
+        """A file where a directory is expected counts as missing"""
+        ok, messages = self.check(
+            dirs=["juce", "modules", "template/module"],
+            files=["CMakeLists.txt", "ssp-sdk", "scripts/createModule.py"])
+        self.assertFalse(ok)
+        self.assertIn("Missing ssp-sdk", messages["FAIL"])
+        self.assertIn("Missing scripts/addDemo.py", messages["FAIL"])
+        self.assertIn("JUCE submodule not initialized", messages["FAIL"])
+
+
+class RelpathsTest(unittest.TestCase):
+    def test_nested_layout(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            make_tree(root, dirs=["target/sysroot", "lib/gcc/target"])
+            self.assertTrue(check._all_relpaths_exist(root, ["target/sysroot", "lib/gcc/target"]))
+            self.assertFalse(check._all_relpaths_exist(root, ["target/sysroot", "lib/gcc/other"]))
+            self.assertFalse(check._all_relpaths_exist(root / "missing", ["target/sysroot"]))
+
+
+class FindModulesTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        root = Path(tmp.name)
+        make_tree(root,
+                  dirs=["modules/common", "modules/inc", "modules/AAAA/Source",
+                        "modules/BBBB/export", "modules/CCCC/Source",
+                        "modules/CCCC/CCCC-rnbo", "modules/DDDD/DDDD-rnbo"],
+                  files=["modules/.gitignore", "modules/AAAA/AAAA-rnbo/AAAA.cpp.h",
+                         "modules/BBBB/export/BBBB.cpp.h", "modules/CCCC/CCCC-rnbo/CCCC.h",
+                         "modules/DDDD/export/DDDD.cpp.h"])
+        self.modules_dir = root / "modules"
+        checker = check.EnvironmentChecker(use_cache=False, project_root=root)
+        self.modules = {m["name"]: m for m in checker.find_modules()}
+
+    def test_skips_shared_dirs(self):
+        self.assertEqual(sorted(self.modules), ["AAAA", "BBBB", "CCCC", "DDDD"])
+
+    def test_complete_module(self):
+        module = self.modules["AAAA"]
+        self.assertTrue(module["has_source"])
+        self.assertTrue(module["has_rnbo_export"])
+        self.assertEqual(module["rnbo_export_path"], self.modules_dir / "AAAA" / "AAAA-rnbo")
+        self.assertEqual(module["missing_files"], [])
+
+    def test_export_fallback_without_source(self):
+        module = self.modules["BBBB"]
+        self.assertFalse(module["has_source"])
+        self.assertTrue(module["has_rnbo_export"])
+        self.assertEqual(module["rnbo_export_path"], self.modules_dir / "BBBB" / "export")
+        self.assertEqual(module["missing_files"], ["Source/"])
+
+    def test_export_without_cpp_h(self):
+        module = self.modules["CCCC"]
+        self.assertTrue(module["has_source"])
+        self.assertFalse(module["has_rnbo_export"])
+        self.assertEqual(module["missing_files"], ["CCCC-rnbo/ (with .cpp.h files)"])
+
+    def test_first_export_dir_wins(self):
+        """Like the baseline, only the first existing export directory is checked"""
+        module = self.modules["DDDD"]
+        self.assertEqual(module["rnbo_export_path"], self.modules_dir / "DDDD" / "DDDD-rnbo")
+        self.assertFalse(module["has_rnbo_export"])
+
+    def test_has_rnbo_export_missing_dir(self):
+        self.assertFalse(check._has_rnbo_export(str(self.modules_dir / "missing")))
+
+
+if __name__ == "__main__":
+    unittest.main()